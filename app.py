@@ -1,29 +1,85 @@
-from flask import Flask, request, jsonify
+import asyncio
+import dataclasses
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Union
+
+import orjson
 from dotenv import load_dotenv
 from neo4j import GraphDatabase
-from neo4j_graphrag.embeddings import OpenAIEmbeddings
 from neo4j_graphrag.generation import GraphRAG
 from neo4j_graphrag.llm import OpenAILLM
 from neo4j_graphrag.retrievers import VectorRetriever
+from quart import Quart, Response, request, jsonify
+from quart.json.provider import DefaultJSONProvider
+
+from semantic_cache import CachedOpenAIEmbeddings, SemanticCache
 
 # Load environment variables
 load_dotenv()
 
-app = Flask(__name__)
 
-# Neo4j connection details
-NEO4J_URI = os.getenv('NEO4J_URI', 'neo4j://localhost:7687')
-NEO4J_USERNAME = os.getenv('NEO4J_USERNAME', 'neo4j')
-NEO4J_PASSWORD = os.getenv('NEO4J_PASSWORD', 'password')
-INDEX_NAME = os.getenv('INDEX_NAME', 'vector-index-name')
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson's native encoder and decoder."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # Formatting kwargs (indent, separators) have no orjson equivalent
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+app = Quart(__name__)
+app.json = OrjsonProvider(app)
+
+
+@dataclasses.dataclass(frozen=True)
+class Settings:
+    """App configuration, read from the environment once at import."""
+
+    neo4j_uri: str
+    neo4j_username: str
+    neo4j_password: str
+    index_name: str
+    semantic_cache_path: str
+    port: int
+    search_workers: int
+    search_timeout: float
+    neo4j_pool_size: int
+
+
+SEARCH_WORKERS = int(os.getenv('SEARCH_WORKERS', 16))
+
+SETTINGS = Settings(
+    neo4j_uri=os.getenv('NEO4J_URI', 'neo4j://localhost:7687'),
+    neo4j_username=os.getenv('NEO4J_USERNAME', 'neo4j'),
+    neo4j_password=os.getenv('NEO4J_PASSWORD', 'password'),
+    index_name=os.getenv('INDEX_NAME', 'vector-index-name'),
+    semantic_cache_path=os.getenv('SEMANTIC_CACHE_PATH', 'semantic_cache.db'),
+    port=int(os.getenv('PORT', 5000)),
+    search_workers=SEARCH_WORKERS,
+    search_timeout=float(os.getenv('SEARCH_TIMEOUT', 30)),
+    # Each search thread holds at most one connection, so never go below
+    # the thread count
+    neo4j_pool_size=max(int(os.getenv('NEO4J_POOL_SIZE', 64)), SEARCH_WORKERS),
+)
+
+# Initialize Neo4j driver. The pool is at least as large as the number of
+# search threads (SEARCH_WORKERS), and connectivity is checked at boot so the
+# first request doesn't pay for the handshake.
+driver = GraphDatabase.driver(
+    SETTINGS.neo4j_uri,
+    auth=(SETTINGS.neo4j_username, SETTINGS.neo4j_password),
+    max_connection_pool_size=SETTINGS.neo4j_pool_size,
+    connection_acquisition_timeout=10,
+)
+driver.verify_connectivity()
 
-# Initialize Neo4j driver
-driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USERNAME, NEO4J_PASSWORD))
 
 # Initialize embeddings and retriever
-embedder = OpenAIEmbeddings(model="text-embedding-3-large")
-retriever = VectorRetriever(driver, INDEX_NAME, embedder)
+embedder = CachedOpenAIEmbeddings(model="text-embedding-3-large")
+retriever = VectorRetriever(driver, SETTINGS.index_name, embedder)
 
 # Initialize LLM
 llm = OpenAILLM(model_name="gpt-4", model_params={"temperature": 0})
@@ -31,29 +87,83 @@ llm = OpenAILLM(model_name="gpt-4", model_params={"temperature": 0})
 # Initialize RAG pipeline
 rag = GraphRAG(retriever=retriever, llm=llm)
 
+# The query embedding is LRU-cached, so rag.search re-embedding it on a miss is free
+semantic_cache = SemanticCache(
+    embedder,
+    path=SETTINGS.semantic_cache_path,
+    namespace=f"{SETTINGS.index_name}:{embedder.model}",
+)
+
+
+# Dedicated pool for blocking searches, sized to the concurrency each worker
+# should sustain; the Neo4j connection pool is never smaller than it.
+SEARCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=SETTINGS.search_workers, thread_name_prefix="search"
+)
+
+
+def search_answer(query_text: str) -> str:
+    response = rag.search(query_text=query_text, retriever_config={"top_k": 5})
+    return response.answer
+
+
+async def warm_up_embedder() -> None:
+    try:
+        await asyncio.to_thread(embedder.embed_query, "warmup")
+    except Exception as e:
+        app.logger.warning(f"Embedder warmup failed: {e}")
+
+
+@app.before_serving
+async def start_warmup() -> None:
+    # Opens the OpenAI HTTP connection in the background so the first real
+    # query doesn't pay for the TLS handshake; startup isn't blocked on it.
+    app.add_background_task(warm_up_embedder)
+
 @app.route('/')
-def home():
+async def home():
     return jsonify({"status": "healthy", "message": "GraphRAG API is running"})
 
+@app.route('/cache_stats')
+async def cache_stats() -> Response:
+    info = embedder.cache_info()
+    lookups = info.hits + info.misses
+    return jsonify({
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    })
+
 @app.route('/webhook', methods=['POST'])
-def webhook():
+async def webhook():
     try:
-        data = request.get_json()
+        data = await request.get_json()
         
         if not data or 'query' not in data:
             return jsonify({"error": "No query provided"}), 400
             
         query_text = data['query']
-        response = rag.search(query_text=query_text, retriever_config={"top_k": 5})
+        # GraphRAG only exposes a blocking search; run it off the event loop so
+        # concurrent requests overlap their OpenAI and Neo4j round trips
+        loop = asyncio.get_running_loop()
+        answer = await asyncio.wait_for(
+            loop.run_in_executor(
+                SEARCH_EXECUTOR, semantic_cache.answer, query_text, search_answer
+            ),
+            timeout=SETTINGS.search_timeout,
+        )
         
         return jsonify({
-            "answer": response.answer,
+            "answer": answer,
             "status": "success"
         })
         
+    except asyncio.TimeoutError:
+        return jsonify({"error": "Search timed out"}), 504
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 if __name__ == '__main__':
-    port = int(os.getenv('PORT', 5000))
-    app.run(host='0.0.0.0', port=port) 
\ No newline at end of file
+    app.run(host='0.0.0.0', port=SETTINGS.port) 
\ No newline at end of file
@@ -51,6 +51,8 @@ async def define_and_run_pipeline(
         relations=RELATIONS,
         potential_schema=POTENTIAL_SCHEMA,
         neo4j_database=DATABASE,
+        # number of chunks sent to the LLM for extraction at the same time
+        max_concurrency=8,
     )
     return await kg_builder.run_async(file_path=str(file_path))
 
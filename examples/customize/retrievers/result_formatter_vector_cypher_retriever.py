@@ -20,11 +20,12 @@ DATABASE = "recommendations"
 INDEX_NAME = "moviePlotsEmbedding"
 
 # for each Movie node matched by the vector search, retrieve more context:
-# the name of all actors starring in that movie
+# the name of (at most 20) actors starring in that movie; capping the
+# traversal server-side keeps high-degree nodes from bloating the result
 RETRIEVAL_QUERY = """
 RETURN  node.title as movieTitle,
         node.plot as moviePlot,
-        collect { MATCH (actor:Actor)-[:ACTED_IN]->(node) RETURN actor.name } AS actors,
+        collect { MATCH (actor:Actor)-[:ACTED_IN]->(node) RETURN actor.name LIMIT 20 } AS actors,
         score as similarityScore
 """
 
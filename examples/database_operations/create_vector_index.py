@@ -15,4 +15,6 @@ create_vector_index(
     embedding_property="vectorProperty",
     dimensions=DIMENSION,
     similarity_fn="euclidean",
+    # On Neo4j 5.23+, quantization_enabled=True/False sets
+    # `vector.quantization.enabled` on the index
 )
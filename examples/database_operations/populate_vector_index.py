@@ -1,13 +1,16 @@
 import neo4j
-from neo4j_graphrag.indexes import upsert_vector
+from neo4j_graphrag.indexes import upsert_vectors
 
 NEO4J_URL = "neo4j://localhost:7687"
 NEO4J_AUTH = ("neo4j", "password")
 
-driver = neo4j.GraphDatabase.driver(NEO4J_URL, auth=NEO4J_AUTH)
+# One driver (and its connection pool) is shared by every upsert;
+# do not create a new driver per node.
+with neo4j.GraphDatabase.driver(NEO4J_URL, auth=NEO4J_AUTH) as driver:
+    ids = ["4:db:1", "4:db:2", "4:db:3"]
+    embedding_property = "embedding"
+    vectors = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]
 
-id = 1
-embedding_property = "embedding"
-vector = [1.0, 2.0, 3.0]
-
-upsert_vector(driver, id, embedding_property, vector)
+    # All vectors are written by a single UNWIND query instead of
+    # one round trip per node; use batch_size to bound large backfills.
+    upsert_vectors(driver, ids, embedding_property, vectors, batch_size=1000)
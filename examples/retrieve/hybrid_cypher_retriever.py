@@ -21,14 +21,17 @@ INDEX_NAME = "moviePlotsEmbedding"
 FULLTEXT_INDEX_NAME = "movieFulltext"
 
 # for each Movie node matched by the vector search, retrieve more context:
-# the name of all actors starring in that movie
+# the name of (at most 20) actors starring in that movie; capping the
+# traversal server-side keeps high-degree nodes from bloating the result
 RETRIEVAL_QUERY = """
 RETURN  node.title as movieTitle,
         node.plot as moviePlot,
-        collect { MATCH (actor:Actor)-[:ACTED_IN]->(node) RETURN actor.name } AS actors,
+        collect { MATCH (actor:Actor)-[:ACTED_IN]->(node) RETURN actor.name LIMIT 20 } AS actors,
         score as similarityScore
 """
 
+embedder = OpenAIEmbeddings()
+
 with neo4j.GraphDatabase.driver(URI, auth=AUTH) as driver:
     # Initialize the retriever
     retriever = HybridCypherRetriever(
@@ -36,7 +39,7 @@ with neo4j.GraphDatabase.driver(URI, auth=AUTH) as driver:
         vector_index_name=INDEX_NAME,
         fulltext_index_name=FULLTEXT_INDEX_NAME,
         # note: embedder is optional if you only use query_vector
-        embedder=OpenAIEmbeddings(),
+        embedder=embedder,
         retrieval_query=RETRIEVAL_QUERY,
         # optionally, configure how to format the results
         # (see corresponding example in 'customize' directory)
@@ -53,3 +56,13 @@ with neo4j.GraphDatabase.driver(URI, auth=AUTH) as driver:
     # note: it is also possible to query from a query_vector directly:
     # query_vector: list[float] = [...]
     # retriever.search(query_vector=query_vector, top_k=5)
+
+    # When running several queries, embed them all in a single request and
+    # pass each precomputed vector alongside its text (the text is still used
+    # by the full-text index), instead of one embedding round trip per query.
+    queries = ["Who were the actors in Avatar?", "Who were the actors in Titanic?"]
+    query_vectors = embedder.embed_documents(queries)
+    for query_text, query_vector in zip(queries, query_vectors):
+        print(
+            retriever.search(query_text=query_text, query_vector=query_vector, top_k=5)
+        )
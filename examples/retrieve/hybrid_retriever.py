@@ -18,13 +18,15 @@ INDEX_NAME = "moviePlotsEmbedding"
 FULLTEXT_INDEX_NAME = "movieFulltext"
 
 
+embedder = OpenAIEmbeddings()
+
 with neo4j.GraphDatabase.driver(URI, auth=AUTH) as driver:
     # Initialize the retriever
     retriever = HybridRetriever(
         driver=driver,
         vector_index_name=INDEX_NAME,
         fulltext_index_name=FULLTEXT_INDEX_NAME,
-        embedder=OpenAIEmbeddings(),
+        embedder=embedder,
         # optionally, provide a list of properties to fetch (default fetch all)
         # return_properties=[],
         # optionally, configure how to format the results
@@ -42,3 +44,13 @@ with neo4j.GraphDatabase.driver(URI, auth=AUTH) as driver:
     # note: it is also possible to query from a query_vector directly:
     # query_vector: list[float] = [...]
     # retriever.search(query_vector=query_vector, top_k=5)
+
+    # When running several queries, embed them all in a single request and
+    # pass each precomputed vector alongside its text (the text is still used
+    # by the full-text index), instead of one embedding round trip per query.
+    queries = ["Find me a movie about aliens", "Find me a movie about a heist"]
+    query_vectors = embedder.embed_documents(queries)
+    for query_text, query_vector in zip(queries, query_vectors):
+        print(
+            retriever.search(query_text=query_text, query_vector=query_vector, top_k=5)
+        )
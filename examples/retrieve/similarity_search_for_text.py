@@ -17,12 +17,14 @@ DATABASE = "recommendations"
 INDEX_NAME = "moviePlotsEmbedding"
 
 
+embedder = OpenAIEmbeddings()
+
 with neo4j.GraphDatabase.driver(URI, auth=AUTH) as driver:
     # Initialize the retriever
     retriever = VectorRetriever(
         driver=driver,
         index_name=INDEX_NAME,
-        embedder=OpenAIEmbeddings(),
+        embedder=embedder,
         # optionally, provide a list of properties to fetch (default fetch all)
         # return_properties=[],
         # optionally, configure how to format the results
@@ -36,3 +38,16 @@ with neo4j.GraphDatabase.driver(URI, auth=AUTH) as driver:
     # (retrieve the top 5 most similar nodes)
     query_text = "Find me a movie about aliens"
     print(retriever.search(query_text=query_text, top_k=5))
+
+    # With a small top_k, the approximate index search may miss close matches;
+    # widening the candidate pool (here to 5 * 4 = 20 nodes) improves recall at
+    # a small latency cost
+    print(retriever.search(query_text=query_text, top_k=5, effective_search_ratio=4))
+
+    # When running several queries, embed them all in a single request and
+    # search from the precomputed vectors, instead of one embedding round trip
+    # per query.
+    queries = ["Find me a movie about aliens", "Find me a movie about a heist"]
+    query_vectors = embedder.embed_documents(queries)
+    for query_vector in query_vectors:
+        print(retriever.search(query_vector=query_vector, top_k=5))
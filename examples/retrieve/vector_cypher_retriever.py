@@ -19,21 +19,24 @@ DATABASE = "recommendations"
 INDEX_NAME = "moviePlotsEmbedding"
 
 # for each Movie node matched by the vector search, retrieve more context:
-# the name of all actors starring in that movie
+# the name of (at most 20) actors starring in that movie; capping the
+# traversal server-side keeps high-degree nodes from bloating the result
 RETRIEVAL_QUERY = """
 RETURN  node.title as movieTitle,
         node.plot as moviePlot,
-        collect { MATCH (actor:Actor)-[:ACTED_IN]->(node) RETURN actor.name } AS actors,
+        collect { MATCH (actor:Actor)-[:ACTED_IN]->(node) RETURN actor.name LIMIT 20 } AS actors,
         score as similarityScore
 """
 
+embedder = OpenAIEmbeddings()
+
 with neo4j.GraphDatabase.driver(URI, auth=AUTH) as driver:
     # Initialize the retriever
     retriever = VectorCypherRetriever(
         driver=driver,
         index_name=INDEX_NAME,
         # note: embedder is optional if you only use query_vector
-        embedder=OpenAIEmbeddings(),
+        embedder=embedder,
         retrieval_query=RETRIEVAL_QUERY,
         # optionally, configure how to format the results
         # (see corresponding example in 'customize' directory)
@@ -50,3 +53,11 @@ with neo4j.GraphDatabase.driver(URI, auth=AUTH) as driver:
     # note: it is also possible to query from a query_vector directly:
     # query_vector: list[float] = [...]
     # retriever.search(query_vector=query_vector, top_k=5)
+
+    # When running several queries, embed them all in a single request and
+    # search from the precomputed vectors, instead of one embedding round trip
+    # per query.
+    queries = ["Who were the actors in Avatar?", "Who were the actors in Titanic?"]
+    query_vectors = embedder.embed_documents(queries)
+    for query_vector in query_vectors:
+        print(retriever.search(query_vector=query_vector, top_k=5))
@@ -0,0 +1,284 @@
+"""Query embedding and answer caches used by the GraphRAG API (app.py).
+
+Kept free of import-time side effects (no driver, no API clients), so the
+caches can be imported and tested without Neo4j or OpenAI.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import sqlite3
+import threading
+import time
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+import numpy as np
+from neo4j_graphrag.embeddings import OpenAIEmbeddings
+from neo4j_graphrag.embeddings.base import Embedder
+
+logger = logging.getLogger(__name__)
+
+simsimd: Optional[ModuleType]
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+
+class CachedOpenAIEmbeddings(OpenAIEmbeddings):
+    """OpenAI embedder that memoizes query embeddings by exact text.
+
+    Repeated queries are served from an in-process LRU cache instead of
+    making another round trip to the OpenAI API. The cache belongs to the
+    instance, so entries are implicitly keyed on the embedding model too.
+    """
+
+    def __init__(
+        self,
+        model: str = "text-embedding-ada-002",
+        cache_size: int = 10_000,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(model=model, **kwargs)
+        self._embed_cached = functools.lru_cache(maxsize=cache_size)(self._embed)
+
+    def _embed(self, text: str) -> tuple[float, ...]:
+        # Tuples are immutable, so callers can't corrupt cached vectors
+        return tuple(super().embed_query(text))
+
+    def embed_query(self, text: str, **kwargs: Any) -> list[float]:
+        if kwargs:
+            return super().embed_query(text, **kwargs)
+        return list(self._embed_cached(text))
+
+    def cache_info(self) -> functools._CacheInfo:
+        return self._embed_cached.cache_info()
+
+
+def batch_cosine(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Cosine similarity between ``query`` and every row of ``matrix``.
+
+    Uses SimSIMD's AVX2/AVX-512/NEON kernels when installed; NumPy otherwise.
+    Both float32 and int8 inputs are supported.
+    """
+    if simsimd is not None:
+        distances = simsimd.cdist(query[None, :], matrix, metric="cosine")
+        similarities: np.ndarray = 1.0 - np.asarray(distances)[0]
+        return similarities
+    # Widen first: int8 dot products would overflow
+    query = query.astype(np.float32)
+    matrix = matrix.astype(np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    similarities = (matrix @ query) / np.where(norms == 0, 1, norms)
+    return similarities
+
+
+class SemanticCache:
+    """Answer cache keyed by query embedding similarity.
+
+    Paraphrased questions ("Who rules Arrakis?" / "Who is the ruler of
+    Arrakis?") embed to nearly identical vectors, so an answer is reused when
+    the cosine similarity to a cached query reaches ``threshold``. Vectors are
+    quantized to int8 and kept in one contiguous matrix, so a lookup is a
+    single vectorized scan over a quarter of the float32 bytes.
+
+    Exact repeats of a cached query are answered from a dict keyed by the
+    query text, before the query is even embedded.
+
+    When ``path`` is given, entries are also written through to a SQLite file
+    and reloaded on startup, so the cache stays warm across restarts. Rows are
+    namespaced so several indexes or embedding models can share one file.
+    Writes are best-effort and happen outside the lock guarding the in-memory
+    cache, so a slow or locked file never stalls lookups: if a write fails, the
+    error is logged and the entry is still cached in memory.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        threshold: float = 0.97,
+        max_entries: int = 5_000,
+        ttl: float = 3600,
+        path: Optional[str] = None,
+        namespace: str = "default",
+    ) -> None:
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.namespace = namespace
+        self._vectors: Optional[np.ndarray] = None
+        self._timestamps = np.empty(0, dtype=np.float64)
+        self._answers: list[str] = []
+        self._queries: list[str] = []
+        self._by_query: dict[str, str] = {}
+        self._ids: list[Optional[int]] = []
+        self._lock = threading.Lock()
+        # Serializes use of the shared connection; never held with self._lock
+        self._db_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            # Several workers may share the file: WAL lets readers proceed
+            # during a write, and the timeout bounds how long a writer waits
+            # for the lock before giving up
+            db = sqlite3.connect(path, timeout=1.0, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS semantic_cache ("
+                "id INTEGER PRIMARY KEY, namespace TEXT NOT NULL, query TEXT, "
+                "embedding BLOB NOT NULL, answer TEXT NOT NULL, "
+                "created_at REAL NOT NULL)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS semantic_cache_namespace "
+                "ON semantic_cache (namespace, id)"
+            )
+            self._db = db
+            self._load(db)
+
+    def _load(self, db: sqlite3.Connection) -> None:
+        with db:
+            db.execute(
+                "DELETE FROM semantic_cache WHERE namespace = ? AND created_at <= ?",
+                (self.namespace, time.time() - self.ttl),
+            )
+        rows = db.execute(
+            "SELECT id, query, embedding, answer, created_at FROM semantic_cache "
+            "WHERE namespace = ? ORDER BY id DESC LIMIT ?",
+            (self.namespace, self.max_entries),
+        ).fetchall()[::-1]
+        if not rows:
+            return
+        self._ids = [row[0] for row in rows]
+        self._queries = [row[1] for row in rows]
+        self._vectors = np.vstack(
+            [np.frombuffer(row[2], dtype=np.int8) for row in rows]
+        )
+        self._answers = [row[3] for row in rows]
+        self._timestamps = np.array([row[4] for row in rows], dtype=np.float64)
+        self._by_query = dict(zip(self._queries, self._answers))
+
+    @staticmethod
+    def _quantize(embedding: Any) -> np.ndarray:
+        # Cosine is scale-invariant, so each vector gets its own scale; spreading
+        # the largest component to +-127 keeps far more precision than
+        # quantizing the unit vector, whose 1536 components are all tiny.
+        vector = np.asarray(embedding, dtype=np.float32)
+        peak = np.abs(vector).max()
+        if peak:
+            vector = vector * (127 / peak)
+        return np.round(vector).astype(np.int8)
+
+    def _scores(self, vector: np.ndarray) -> np.ndarray:
+        assert self._vectors is not None
+        return batch_cosine(vector, self._vectors)
+
+    def _persist(
+        self, query_text: str, vector: np.ndarray, answer: str, created_at: float
+    ) -> Optional[int]:
+        if self._db is None:
+            return None
+        try:
+            with self._db_lock, self._db:
+                return self._db.execute(
+                    "INSERT INTO semantic_cache "
+                    "(namespace, query, embedding, answer, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, query_text, vector.tobytes(), answer, created_at),
+                ).lastrowid
+        except sqlite3.Error:
+            logger.warning("Could not persist semantic cache entry", exc_info=True)
+            return None
+
+    def _delete_rows(self, ids: list[int]) -> None:
+        # Only this instance's own rows are deleted: other workers sharing the
+        # file interleave ids
+        if self._db is None or not ids:
+            return
+        try:
+            with self._db_lock, self._db:
+                self._db.execute(
+                    "DELETE FROM semantic_cache WHERE namespace = ? "
+                    f"AND id IN ({', '.join('?' * len(ids))})",
+                    (self.namespace, *ids),
+                )
+        except sqlite3.Error:
+            logger.warning("Could not evict semantic cache rows", exc_info=True)
+
+    def _evict(self, count: int) -> list[int]:
+        """Drop the ``count`` oldest entries from memory.
+
+        Returns the ids of their rows, to be deleted once ``self._lock`` is released.
+        """
+        # Entries are appended in time order, so expired and overflowing
+        # entries are always the oldest ones at the head
+        ids = [entry_id for entry_id in self._ids[:count] if entry_id is not None]
+        for query, answer in zip(self._queries[:count], self._answers[:count]):
+            # A newer entry may have been stored for the same text
+            if self._by_query.get(query) is answer:
+                del self._by_query[query]
+        assert self._vectors is not None
+        self._vectors = np.ascontiguousarray(self._vectors[count:])
+        self._timestamps = self._timestamps[count:]
+        self._answers = self._answers[count:]
+        self._queries = self._queries[count:]
+        self._ids = self._ids[count:]
+        return ids
+
+    def _expire(self) -> list[int]:
+        cutoff = time.time() - self.ttl
+        expired = int(np.count_nonzero(self._timestamps <= cutoff))
+        return self._evict(expired) if expired else []
+
+    def lookup_text(self, query_text: str) -> Optional[str]:
+        with self._lock:
+            evicted = self._expire()
+            cached = self._by_query.get(query_text)
+        self._delete_rows(evicted)
+        return cached
+
+    def lookup(self, vector: np.ndarray) -> Optional[str]:
+        cached = None
+        with self._lock:
+            evicted = self._expire()
+            if self._answers:
+                scores = self._scores(vector)
+                best = int(np.argmax(scores))
+                if scores[best] >= self.threshold:
+                    cached = self._answers[best]
+        self._delete_rows(evicted)
+        return cached
+
+    def insert(self, query_text: str, vector: np.ndarray, answer: str) -> None:
+        created_at = time.time()
+        entry_id = self._persist(query_text, vector, answer, created_at)
+        evicted: list[int] = []
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = vector[None, :].copy()
+            else:
+                overflow = len(self._answers) - self.max_entries + 1
+                if overflow > 0:
+                    evicted = self._evict(overflow)
+                self._vectors = np.vstack([self._vectors, vector])
+            self._timestamps = np.append(self._timestamps, created_at)
+            self._answers.append(answer)
+            self._queries.append(query_text)
+            self._by_query[query_text] = answer
+            self._ids.append(entry_id)
+        self._delete_rows(evicted)
+
+    def answer(self, query_text: str, search_fn: Callable[[str], str]) -> str:
+        """Return a cached answer for a similar query, else call ``search_fn``."""
+        cached = self.lookup_text(query_text)
+        if cached is not None:
+            return cached
+        vector = self._quantize(self.embedder.embed_query(query_text))
+        cached = self.lookup(vector)
+        if cached is not None:
+            return cached
+        answer = search_fn(query_text)
+        self.insert(query_text, vector, answer)
+        return answer
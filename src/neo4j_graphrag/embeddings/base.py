@@ -33,3 +33,18 @@ class Embedder(ABC):
         Returns:
             list[float]: A vector embedding.
         """
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch of texts.
+
+        The default implementation calls :meth:`embed_query` once per text.
+        Embedders backed by an API that accepts several inputs per request
+        should override it to save round trips.
+
+        Args:
+            texts (list[str]): Texts to convert to vector embeddings
+
+        Returns:
+            list[list[float]]: One vector embedding per text, in input order.
+        """
+        return [self.embed_query(text) for text in texts]
@@ -63,6 +63,29 @@ class BaseOpenAIEmbeddings(Embedder, abc.ABC):
         embedding: list[float] = response.data[0].embedding
         return embedding
 
+    def embed_documents(
+        self, texts: list[str], batch_size: int = 16, **kwargs: Any
+    ) -> list[list[float]]:
+        """
+        Generate embeddings for several texts, sending up to ``batch_size`` texts
+        per OpenAI request instead of one request per text.
+
+        Args:
+            texts (list[str]): The texts to generate embeddings for.
+            batch_size (int): Maximum number of texts per request. Defaults to 16,
+                which some Azure OpenAI deployments require, and which keeps a batch of
+                inputs under the per-input token limit (8191) below OpenAI's 300k tokens
+                per request cap. Raise it for short texts to save round trips.
+            **kwargs (Any): Additional arguments to pass to the OpenAI embedding generation function.
+        """
+        embeddings: list[list[float]] = []
+        for start in range(0, len(texts), batch_size):
+            response = self.client.embeddings.create(
+                input=texts[start : start + batch_size], model=self.model, **kwargs
+            )
+            embeddings.extend(item.embedding for item in response.data)
+        return embeddings
+
 
 class OpenAIEmbeddings(BaseOpenAIEmbeddings):
     """
@@ -45,3 +45,23 @@ class SentenceTransformerEmbeddings(Embedder):
             return [item for tensor in result for item in tensor.flatten().tolist()]
         else:
             raise ValueError("Unexpected return type from model encoding")
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch of texts with a single ``encode`` call, letting the
+        model process them in batches instead of one forward pass per text.
+
+        Args:
+            texts (list[str]): Texts to convert to vector embeddings
+
+        Returns:
+            list[list[float]]: One vector embedding per text, in input order.
+        """
+        result = self.model.encode(texts)
+        if isinstance(result, self.torch.Tensor) or isinstance(result, self.np.ndarray):
+            return [row.flatten().tolist() for row in result]
+        elif isinstance(result, list) and all(
+            isinstance(x, self.torch.Tensor) for x in result
+        ):
+            return [tensor.flatten().tolist() for tensor in result]
+        else:
+            raise ValueError("Unexpected return type from model encoding")
@@ -12,6 +12,8 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from typing import Optional
+
 from pydantic import validate_call
 
 from neo4j_graphrag.embeddings.base import Embedder
@@ -24,6 +26,9 @@ class TextChunkEmbedder(Component):
 
     Args:
         embedder (Embedder): The embedder to use to create the embeddings.
+        batch_size (Optional[int]): Maximum number of chunks passed to the embedder's
+            ``embed_documents`` in one call. Defaults to None, which passes all chunks
+            of a document at once and leaves request batching to the embedder.
 
     Example:
 
@@ -40,20 +45,23 @@ class TextChunkEmbedder(Component):
 
     """
 
-    def __init__(self, embedder: Embedder):
+    def __init__(self, embedder: Embedder, batch_size: Optional[int] = None):
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
         self._embedder = embedder
+        self.batch_size = batch_size
 
-    def _embed_chunk(self, text_chunk: TextChunk) -> TextChunk:
-        """Embed a single text chunk.
+    def _embed_chunk(self, text_chunk: TextChunk, embedding: list[float]) -> TextChunk:
+        """Attach an embedding to a single text chunk.
 
         Args:
-            text_chunk (TextChunk): The text chunk to embed.
+            text_chunk (TextChunk): The text chunk that was embedded.
+            embedding (list[float]): The embedding of the text chunk's text.
 
         Returns:
             TextChunk: The text chunk with an added "embedding" key in its
             metadata containing the embeddings of the text chunk's text.
         """
-        embedding = self._embedder.embed_query(text_chunk.text)
         metadata = text_chunk.metadata if text_chunk.metadata else {}
         metadata["embedding"] = embedding
         return TextChunk(
@@ -67,12 +75,33 @@ class TextChunkEmbedder(Component):
     async def run(self, text_chunks: TextChunks) -> TextChunks:
         """Embed a list of text chunks.
 
+        Chunk texts are passed to the embedder's ``embed_documents`` in groups of
+        ``batch_size`` (all at once by default), so embedders supporting batch
+        requests avoid one round trip per chunk.
+
         Args:
             text_chunks (TextChunks): The text chunks to embed.
 
         Returns:
             TextChunks: The input text chunks with each one having an added embedding.
+
+        Raises:
+            ValueError: If the embedder does not return exactly one embedding per chunk.
         """
+        texts = [text_chunk.text for text_chunk in text_chunks.chunks]
+        batch_size = self.batch_size or max(len(texts), 1)
+        embeddings: list[list[float]] = []
+        for start in range(0, len(texts), batch_size):
+            embeddings.extend(
+                self._embedder.embed_documents(texts[start : start + batch_size])
+            )
+        if len(embeddings) != len(text_chunks.chunks):
+            raise ValueError(
+                f"Expected {len(text_chunks.chunks)} embeddings, got {len(embeddings)}"
+            )
         return TextChunks(
-            chunks=[self._embed_chunk(text_chunk) for text_chunk in text_chunks.chunks]
+            chunks=[
+                self._embed_chunk(text_chunk, embedding)
+                for text_chunk, embedding in zip(text_chunks.chunks, embeddings)
+            ]
         )
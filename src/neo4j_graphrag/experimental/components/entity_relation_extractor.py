@@ -335,5 +335,6 @@ class LLMEntityRelationExtractor(EntityRelationExtractor):
         ]
         chunk_graphs: list[Neo4jGraph] = list(await asyncio.gather(*tasks))
         graph = self.combine_chunk_graphs(lexical_graph, chunk_graphs)
-        logger.debug(f"Extracted graph: {prettify(graph)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Extracted graph: {prettify(graph)}")
         return graph
@@ -124,9 +124,10 @@ class PipelineRunner:
             )
         else:
             run_param = deep_update(self.run_params, user_input)
-        logger.info(
-            f"PIPELINE_RUNNER: starting pipeline {self.pipeline} with run_params={prettify(run_param)}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"PIPELINE_RUNNER: starting pipeline {self.pipeline} with run_params={prettify(run_param)}"
+            )
         result = await self.pipeline.run(data=run_param)
         if self.do_cleaning:
             await self.close()
@@ -14,7 +14,7 @@
 #  limitations under the License.
 from typing import Any, ClassVar, Literal, Optional, Sequence, Union
 
-from pydantic import ConfigDict
+from pydantic import ConfigDict, PositiveInt
 
 from neo4j_graphrag.experimental.components.embedder import TextChunkEmbedder
 from neo4j_graphrag.experimental.components.entity_relation_extractor import (
@@ -72,6 +72,7 @@ class SimpleKGPipelineConfig(TemplatePipelineConfig):
     relations: Sequence[RelationInputType] = []
     potential_schema: Optional[list[tuple[str, str, str]]] = None
     on_error: OnError = OnError.IGNORE
+    max_concurrency: PositiveInt = 5
     prompt_template: Union[ERExtractionTemplate, str] = ERExtractionTemplate()
     perform_entity_resolution: bool = True
     lexical_graph_config: Optional[LexicalGraphConfig] = None
@@ -125,6 +126,7 @@ class SimpleKGPipelineConfig(TemplatePipelineConfig):
             llm=self.get_default_llm(),
             prompt_template=self.prompt_template,
             on_error=self.on_error,
+            max_concurrency=self.max_concurrency,
         )
 
     def _get_writer(self) -> KGWriter:
@@ -68,6 +68,7 @@ class SimpleKGPipeline:
         pdf_loader (Optional[DataLoader]): A PDF loader component. Defaults to PdfLoader().
         kg_writer (Optional[KGWriter]): A knowledge graph writer component. Defaults to Neo4jWriter().
         on_error (str): Error handling strategy for the Entity and relation extractor. Defaults to "IGNORE", where chunk will be ignored if extraction fails. Possible values: "RAISE" or "IGNORE".
+        max_concurrency (int): The maximum number of chunks the Entity and relation extractor sends to the LLM concurrently. Must be at least 1. Defaults to 5.
         perform_entity_resolution (bool): Merge entities with same label and name. Default: True
         prompt_template (str): A custom prompt template to use for extraction.
         lexical_graph_config (Optional[LexicalGraphConfig], optional): Lexical graph configuration to customize node labels and relationship types in the lexical graph.
@@ -86,6 +87,7 @@ class SimpleKGPipeline:
         pdf_loader: Optional[DataLoader] = None,
         kg_writer: Optional[KGWriter] = None,
         on_error: str = "IGNORE",
+        max_concurrency: int = 5,
         prompt_template: Union[ERExtractionTemplate, str] = ERExtractionTemplate(),
         perform_entity_resolution: bool = True,
         lexical_graph_config: Optional[LexicalGraphConfig] = None,
@@ -105,6 +107,7 @@ class SimpleKGPipeline:
                 kg_writer=ComponentType(kg_writer) if kg_writer else None,
                 text_splitter=ComponentType(text_splitter) if text_splitter else None,
                 on_error=OnError(on_error),
+                max_concurrency=max_concurrency,
                 prompt_template=prompt_template,
                 perform_entity_resolution=perform_entity_resolution,
                 lexical_graph_config=lexical_graph_config,
@@ -83,13 +83,18 @@ class TaskPipelineNode(PipelineNode):
 
     async def run(self, inputs: dict[str, Any]) -> RunResult | None:
         """Main method to execute the task."""
-        logger.debug(f"TASK START {self.name=} input={prettify(inputs)}")
+        # prettify walks (and model_dumps) the whole payload, so only pay for
+        # it when the message is actually emitted
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"TASK START {self.name=} input={prettify(inputs)}")
         start_time = default_timer()
         res = await self.execute(**inputs)
         end_time = default_timer()
-        logger.debug(
-            f"TASK FINISHED {self.name} in {end_time - start_time} res={prettify(res)}"
-        )
+        if debug:
+            logger.debug(
+                f"TASK FINISHED {self.name} in {end_time - start_time} res={prettify(res)}"
+            )
         return res
 
 
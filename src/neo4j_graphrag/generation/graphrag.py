@@ -138,8 +138,8 @@ class GraphRAG:
         prompt = self.prompt_template.format(
             query_text=query_text, context=context, examples=validated_data.examples
         )
-        logger.debug(f"RAG: retriever_result={retriever_result}")
-        logger.debug(f"RAG: prompt={prompt}")
+        logger.debug("RAG: retriever_result=%s", retriever_result)
+        logger.debug("RAG: prompt=%s", prompt)
         answer = self.llm.invoke(
             prompt,
             message_history,
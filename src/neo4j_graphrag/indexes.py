@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import logging
 import warnings
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Any, List, Literal, Optional, Sequence, Union
 
 import neo4j
 from pydantic import ValidationError
@@ -31,6 +31,9 @@ from neo4j_graphrag.neo4j_queries import (
 from .exceptions import Neo4jIndexError, Neo4jInsertionError
 from .types import EntityType, FulltextIndexModel, VectorIndexModel
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +46,7 @@ def create_vector_index(
     similarity_fn: Literal["euclidean", "cosine"],
     fail_if_exists: bool = False,
     neo4j_database: Optional[str] = None,
+    quantization_enabled: Optional[bool] = None,
 ) -> None:
     """
     This method constructs a Cypher query and executes it
@@ -89,6 +93,9 @@ def create_vector_index(
             ``euclidean`` or ``cosine``.
         fail_if_exists (bool): If True raise an error if the index already exists. Defaults to False.
         neo4j_database (Optional[str]): The name of the Neo4j database. If not provided, this defaults to the server's default database ("neo4j" by default) (`see reference to documentation <https://neo4j.com/docs/operations-manual/current/database-administration/#manage-databases-default>`_).
+        quantization_enabled (Optional[bool]): Whether the index stores quantized (int8) vectors,
+            reducing its memory footprint at a small cost in accuracy. Requires Neo4j 5.23 or later.
+            If not provided, the server default is used.
 
     Raises:
         ValueError: If validation of the input arguments fail.
@@ -109,16 +116,21 @@ def create_vector_index(
         ) from e
 
     try:
+        parameters = {
+            "name": name,
+            "dimensions": dimensions,
+            "similarity_fn": similarity_fn,
+        }
+        index_config = "`vector.dimensions`: toInteger($dimensions), `vector.similarity_function`: $similarity_fn"
+        if quantization_enabled is not None:
+            index_config += ", `vector.quantization.enabled`: $quantization_enabled"
+            parameters["quantization_enabled"] = quantization_enabled
         query = (
             f"CREATE VECTOR INDEX $name {'' if fail_if_exists else 'IF NOT EXISTS'} FOR (n:{label}) ON n.{embedding_property} OPTIONS "
-            "{ indexConfig: { `vector.dimensions`: toInteger($dimensions), `vector.similarity_function`: $similarity_fn } }"
+            f"{{ indexConfig: {{ {index_config} }} }}"
         )
         logger.info(f"Creating vector index named '{name}'")
-        driver.execute_query(
-            query,
-            {"name": name, "dimensions": dimensions, "similarity_fn": similarity_fn},
-            database_=neo4j_database,
-        )
+        driver.execute_query(query, parameters, database_=neo4j_database)
     except neo4j.exceptions.ClientError as e:
         raise Neo4jIndexError(f"Neo4j vector index creation failed: {e.message}") from e
 
@@ -252,14 +264,18 @@ def upsert_vectors(
     driver: neo4j.Driver,
     ids: List[str],
     embedding_property: str,
-    embeddings: List[List[float]],
+    embeddings: Union[Sequence[Sequence[float]], npt.NDArray[Any]],
     neo4j_database: Optional[str] = None,
     entity_type: EntityType = EntityType.NODE,
+    batch_size: Optional[int] = None,
 ) -> None:
     """
     This method constructs a Cypher query and executes it to upsert
     (insert or update) embeddings on a set of nodes or relationships.
 
+    All embeddings of a batch are sent in a single ``UNWIND`` query, so large
+    backfills cost one round trip per batch rather than one per vector.
+
     Example:
 
     .. code-block:: python
@@ -291,11 +307,14 @@ def upsert_vectors(
         driver (neo4j.Driver): Neo4j Python driver instance.
         ids (List[int]): The element IDs of the nodes or relationships.
         embedding_property (str): The name of the property to store the vectors in.
-        embeddings (List[List[float]]): The list of vectors to store, one per ID.
+        embeddings (Union[Sequence[Sequence[float]], numpy.typing.NDArray[Any]]): The vectors to store,
+            one per ID, either as a sequence of vectors or as a 2D ``numpy`` array.
         neo4j_database (Optional[str]): The name of the Neo4j database.
             If not provided, defaults to the server's default database. 'neo4j' by default.
         entity_type (EntityType): Specifies whether to upsert to nodes ('NODE') or relationships ('RELATIONSHIP').
             Defaults to 'NODE'.
+        batch_size (Optional[int]): Maximum number of embeddings written per query, each batch being
+            committed in its own transaction. If not provided, all embeddings are written in a single query.
 
     Raises:
         ValueError: If the lengths of IDs and embeddings do not match, or if embeddings are not of uniform dimension.
@@ -311,17 +330,21 @@ def upsert_vectors(
         raise ValueError("ids and embeddings must be the same length")
     if not all(len(embedding) == len(embeddings[0]) for embedding in embeddings):
         raise ValueError("All embeddings must be of the same size")
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+    rows = [
+        {"id": id, "embedding": embedding} for id, embedding in zip(ids, embeddings)
+    ]
+    step = batch_size or max(len(rows), 1)
     try:
-        parameters = {
-            "rows": [
-                {"id": id, "embedding": embedding}
-                for id, embedding in zip(ids, embeddings)
-            ],
-            "embedding_property": embedding_property,
-        }
-        driver.execute_query(
-            query_=query, parameters_=parameters, database_=neo4j_database
-        )
+        for start in range(0, len(rows), step):
+            parameters = {
+                "rows": rows[start : start + step],
+                "embedding_property": embedding_property,
+            }
+            driver.execute_query(
+                query_=query, parameters_=parameters, database_=neo4j_database
+            )
     except neo4j.exceptions.ClientError as e:
         raise Neo4jInsertionError(
             f"Upserting vectors to Neo4j failed: {e.message}"
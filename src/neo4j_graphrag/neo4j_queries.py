@@ -123,7 +123,7 @@ UPSERT_VECTORS_ON_NODE_QUERY = (
     "WHERE elementId(n) = row.id "
     "WITH n, row "
     "CALL db.create.setNodeVectorProperty(n, $embedding_property, row.embedding) "
-    "RETURN n"
+    "RETURN count(n) AS count"
 )
 
 # Deprecated, remove along with upsert_vector_on_relationship
@@ -141,7 +141,7 @@ UPSERT_VECTORS_ON_RELATIONSHIP_QUERY = (
     "WHERE elementId(r) = row.id "
     "WITH r, row "
     "CALL db.create.setRelationshipVectorProperty(r, $embedding_property, row.embedding) "
-    "RETURN r"
+    "RETURN count(r) AS count"
 )
 
 
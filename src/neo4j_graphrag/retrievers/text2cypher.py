@@ -16,6 +16,8 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+from collections import OrderedDict
 from typing import Any, Callable, Dict, Optional
 
 import neo4j
@@ -99,6 +101,9 @@ class Text2CypherRetriever(Retriever):
         neo4j_schema (Optional[str]): Neo4j schema used to generate the Cypher query.
         examples (Optional[list[str], optional): Optional user input/query pairs for the LLM to use as examples.
         custom_prompt (Optional[str]): Optional custom prompt to use instead of auto generated prompt. Will include the neo4j_schema for schema and examples for examples prompt parameters, if they are provided.
+        cypher_cache_size (int): Maximum number of generated Cypher queries kept in memory, keyed by the full LLM prompt,
+            so that repeating a question skips the LLM call. Only queries that ran successfully are cached.
+            Defaults to 0 (no caching).
 
     Raises:
         RetrieverInitializationError: If validation of the input arguments fail.
@@ -115,6 +120,7 @@ class Text2CypherRetriever(Retriever):
         ] = None,
         custom_prompt: Optional[str] = None,
         neo4j_database: Optional[str] = None,
+        cypher_cache_size: int = 0,
     ) -> None:
         try:
             driver_model = Neo4jDriverModel(driver=driver)
@@ -130,6 +136,7 @@ class Text2CypherRetriever(Retriever):
                 result_formatter=result_formatter,
                 custom_prompt=custom_prompt,
                 neo4j_database=neo4j_database,
+                cypher_cache_size=cypher_cache_size,
             )
         except ValidationError as e:
             raise RetrieverInitializationError(e.errors()) from e
@@ -141,6 +148,9 @@ class Text2CypherRetriever(Retriever):
         self.examples = validated_data.examples
         self.result_formatter = validated_data.result_formatter
         self.custom_prompt = validated_data.custom_prompt
+        self.cypher_cache_size = validated_data.cypher_cache_size
+        self._cypher_cache: OrderedDict[str, str] = OrderedDict()
+        self._cypher_cache_lock = threading.Lock()
         if validated_data.custom_prompt:
             if (
                 validated_data.neo4j_schema_model
@@ -165,6 +175,22 @@ class Text2CypherRetriever(Retriever):
                     ) from e
         self.neo4j_schema = neo4j_schema
 
+    def _get_cached_cypher(self, prompt: str) -> Optional[str]:
+        with self._cypher_cache_lock:
+            cypher = self._cypher_cache.get(prompt)
+            if cypher is not None:
+                self._cypher_cache.move_to_end(prompt)
+            return cypher
+
+    def _cache_cypher(self, prompt: str, cypher: str) -> None:
+        if not self.cypher_cache_size:
+            return
+        with self._cypher_cache_lock:
+            self._cypher_cache[prompt] = cypher
+            self._cypher_cache.move_to_end(prompt)
+            if len(self._cypher_cache) > self.cypher_cache_size:
+                self._cypher_cache.popitem(last=False)
+
     def get_search_results(
         self, query_text: str, prompt_params: Optional[Dict[str, Any]] = None
     ) -> RawSearchResult:
@@ -210,8 +236,10 @@ class Text2CypherRetriever(Retriever):
         logger.debug("Text2CypherRetriever prompt: %s", prompt)
 
         try:
-            llm_result = self.llm.invoke(prompt)
-            t2c_query = extract_cypher(llm_result.content)
+            t2c_query = self._get_cached_cypher(prompt)
+            if t2c_query is None:
+                llm_result = self.llm.invoke(prompt)
+                t2c_query = extract_cypher(llm_result.content)
             logger.debug("Text2CypherRetriever Cypher query: %s", t2c_query)
             records, _, _ = self.driver.execute_query(
                 query_=t2c_query,
@@ -222,6 +250,7 @@ class Text2CypherRetriever(Retriever):
             raise Text2CypherRetrievalError(
                 f"Failed to get search result: {e.message}"
             ) from e
+        self._cache_cypher(prompt, t2c_query)
 
         return RawSearchResult(
             records=records,
@@ -14,6 +14,7 @@
 #  limitations under the License.
 from __future__ import annotations
 
+import warnings
 from typing import Any, Dict, List, Optional, Tuple
 
 import neo4j
@@ -28,7 +29,11 @@ EXHAUSTIVE_SEARCH_LIMIT = 10000
 LIST_LIMIT = 128
 DISTINCT_VALUE_LIMIT = 10
 
-NODE_PROPERTIES_QUERY = (
+# Deprecated: superseded by SCHEMA_QUERY and only reachable through the
+# module-level __getattr__ below, which warns on access.
+_DEPRECATED_QUERIES: dict[str, str] = {}
+
+_DEPRECATED_QUERIES["NODE_PROPERTIES_QUERY"] = (
     "CALL apoc.meta.data() "
     "YIELD label, other, elementType, type, property "
     "WHERE NOT type = 'RELATIONSHIP' AND elementType = 'node' "
@@ -37,7 +42,7 @@ NODE_PROPERTIES_QUERY = (
     "RETURN {label: nodeLabel, properties: properties} AS output"
 )
 
-REL_PROPERTIES_QUERY = (
+_DEPRECATED_QUERIES["REL_PROPERTIES_QUERY"] = (
     "CALL apoc.meta.data() "
     "YIELD label, other, elementType, type, property "
     "WHERE NOT type = 'RELATIONSHIP' AND elementType = 'relationship' "
@@ -46,7 +51,7 @@ REL_PROPERTIES_QUERY = (
     "RETURN {type: relType, properties: properties} AS output"
 )
 
-REL_QUERY = (
+_DEPRECATED_QUERIES["REL_QUERY"] = (
     "CALL apoc.meta.data() "
     "YIELD label, other, elementType, type, property "
     "WHERE type = 'RELATIONSHIP' AND elementType = 'node' "
@@ -56,6 +61,17 @@ REL_QUERY = (
     "RETURN {start: label, type: property, end: toString(other_node)} AS output"
 )
 
+# Single pass over apoc.meta.data(), which samples the whole graph: node
+# properties, relationship properties and relationship patterns are all
+# derived from its rows client-side.
+SCHEMA_QUERY = (
+    "CALL apoc.meta.data() "
+    "YIELD label, other, elementType, type, property "
+    "WHERE (elementType = 'node' AND NOT label IN $EXCLUDED_LABELS) "
+    "OR (elementType = 'relationship' AND NOT label IN $EXCLUDED_RELS) "
+    "RETURN label, other, elementType, type, property"
+)
+
 INDEX_QUERY = (
     "CALL apoc.schema.nodes() YIELD label, properties, type, size, valuesSelectivity "
     "WHERE type = 'RANGE' RETURN *, "
@@ -71,6 +87,18 @@ SCHEMA_COUNTS_QUERY = (
 )
 
 
+def __getattr__(name: str) -> str:
+    if name in _DEPRECATED_QUERIES:
+        warnings.warn(
+            f"'{name}' is deprecated and will be removed in a future version, "
+            "'get_structured_schema' now uses 'SCHEMA_QUERY' instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return _DEPRECATED_QUERIES[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _clean_string_values(text: str) -> str:
     """Clean string values for schema.
 
@@ -280,51 +308,41 @@ def get_structured_schema(
         sanitize (bool): A flag to indicate whether to remove lists with
             more than 128 elements from results. Useful for removing
             embedding-like properties from database responses. Default is False.
+            Only applies to the constraint and index queries (and the property
+            statistics queries when ``is_enhanced`` is True): the ``apoc.meta.data``
+            query only returns label, type and property names and is never sanitized.
 
     Returns:
         dict[str, Any]: the graph schema information in a structured format.
     """
-    node_properties = [
-        data["output"]
-        for data in query_database(
-            driver=driver,
-            query=NODE_PROPERTIES_QUERY,
-            params={
-                "EXCLUDED_LABELS": EXCLUDED_LABELS
-                + [BASE_ENTITY_LABEL, BASE_KG_BUILDER_LABEL]
-            },
-            database=database,
-            timeout=timeout,
-            sanitize=sanitize,
-        )
-    ]
-
-    rel_properties = [
-        data["output"]
-        for data in query_database(
-            driver=driver,
-            query=REL_PROPERTIES_QUERY,
-            params={"EXCLUDED_LABELS": EXCLUDED_RELS},
-            database=database,
-            timeout=timeout,
-            sanitize=sanitize,
-        )
-    ]
+    excluded_labels = EXCLUDED_LABELS + [BASE_ENTITY_LABEL, BASE_KG_BUILDER_LABEL]
+    # The rows only hold label, type and property names, so there is nothing
+    # to sanitize; `other` lists every label a relationship type connects to
+    # and must not be truncated.
+    metadata_rows = query_database(
+        driver=driver,
+        query=SCHEMA_QUERY,
+        params={"EXCLUDED_LABELS": excluded_labels, "EXCLUDED_RELS": EXCLUDED_RELS},
+        database=database,
+        timeout=timeout,
+    )
 
-    relationships = [
-        data["output"]
-        for data in query_database(
-            driver=driver,
-            query=REL_QUERY,
-            params={
-                "EXCLUDED_LABELS": EXCLUDED_LABELS
-                + [BASE_ENTITY_LABEL, BASE_KG_BUILDER_LABEL]
-            },
-            database=database,
-            timeout=timeout,
-            sanitize=sanitize,
+    node_props: dict[str, list[dict[str, Any]]] = {}
+    rel_props: dict[str, list[dict[str, Any]]] = {}
+    relationships: list[dict[str, Any]] = []
+    for row in metadata_rows:
+        if row["type"] == "RELATIONSHIP":
+            if row["elementType"] == "node":
+                relationships.extend(
+                    {"start": row["label"], "type": row["property"], "end": str(end)}
+                    for end in row["other"]
+                    if end not in excluded_labels
+                )
+            continue
+        props = node_props if row["elementType"] == "node" else rel_props
+        props.setdefault(row["label"], []).append(
+            {"property": row["property"], "type": row["type"]}
         )
-    ]
 
     # Get constraints and indexes
     try:
@@ -347,8 +365,8 @@ def get_structured_schema(
         index = []
 
     structured_schema = {
-        "node_props": {el["label"]: el["properties"] for el in node_properties},
-        "rel_props": {el["type"]: el["properties"] for el in rel_properties},
+        "node_props": node_props,
+        "rel_props": rel_props,
         "relationships": relationships,
         "metadata": {"constraint": constraint, "index": index},
     }
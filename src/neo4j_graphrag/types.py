@@ -21,6 +21,7 @@ from typing import Any, Callable, Literal, Optional, TypedDict, Union
 import neo4j
 from pydantic import (
     BaseModel,
+    NonNegativeInt,
     ConfigDict,
     PositiveInt,
     field_validator,
@@ -295,6 +296,7 @@ class Text2CypherRetrieverModel(BaseModel):
     result_formatter: Optional[Callable[[neo4j.Record], RetrieverResultItem]] = None
     custom_prompt: Optional[str] = None
     neo4j_database: Optional[str] = None
+    cypher_cache_size: NonNegativeInt = 0
 
 
 class Neo4jMessageHistoryModel(BaseModel):
@@ -191,6 +191,21 @@ def setup_neo4j_for_schema_query_with_excluded_labels(driver: Driver) -> None:
     )
 
 
+@pytest.fixture(scope="module")
+def setup_neo4j_for_schema_query_with_excluded_end_labels(driver: Driver) -> None:
+    # Delete all nodes in the graph
+    driver.execute_query("MATCH (n) DETACH DELETE n")
+    # Relate a regular label to another regular label and to excluded ones
+    driver.execute_query(
+        """
+        CREATE (la:LabelA)
+        CREATE (la)-[:REL_TYPE]->(:LabelB)
+        CREATE (la)-[:REL_TYPE]->(:_Bloom_Perspective_)
+        CREATE (la)-[:REL_TYPE]->(:__Entity__)
+        """
+    )
+
+
 @pytest.fixture(scope="module")
 def setup_neo4j_for_kg_construction(driver: Driver) -> None:
     # Delete all nodes and indexes in the graph
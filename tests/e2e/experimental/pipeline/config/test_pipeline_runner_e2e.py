@@ -121,8 +121,8 @@ async def test_simple_kg_pipeline_from_json_config(
             ),
         ]
     )
-    mock_embedder.return_value.embed_query.side_effect = [
-        [1.0, 2.0],
+    mock_embedder.return_value.embed_documents.side_effect = [
+        [[1.0, 2.0]],
     ]
 
     os.environ["NEO4J_URI"] = "neo4j://localhost:7687"
@@ -212,8 +212,8 @@ async def test_simple_kg_pipeline_from_yaml_config(
             ),
         ]
     )
-    mock_embedder.return_value.embed_query.side_effect = [
-        [1.0, 2.0],
+    mock_embedder.return_value.embed_documents.side_effect = [
+        [[1.0, 2.0]],
     ]
 
     os.environ["NEO4J_URI"] = "neo4j://localhost:7687"
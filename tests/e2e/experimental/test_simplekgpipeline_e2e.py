@@ -46,7 +46,7 @@ async def test_pipeline_builder_happy_path(
     chunks must be in the DB
     """
     driver.execute_query("MATCH (n) DETACH DELETE n")
-    embedder.embed_query.return_value = [1, 2, 3]
+    embedder.embed_documents.side_effect = lambda texts: [[1, 2, 3] for _ in texts]
     llm.ainvoke.side_effect = [
         LLMResponse(
             content="""{
@@ -135,7 +135,7 @@ async def test_pipeline_builder_two_documents(
     chunks must be in the DB
     """
     driver.execute_query("MATCH (n) DETACH DELETE n")
-    embedder.embed_query.return_value = [1, 2, 3]
+    embedder.embed_documents.side_effect = lambda texts: [[1, 2, 3] for _ in texts]
     llm.ainvoke.side_effect = [
         # first document
         # first chunk
@@ -215,7 +215,7 @@ async def test_pipeline_builder_same_document_two_runs(
     chunks must be in the DB
     """
     driver.execute_query("MATCH (n) DETACH DELETE n")
-    embedder.embed_query.return_value = [1, 2, 3]
+    embedder.embed_documents.side_effect = lambda texts: [[1, 2, 3] for _ in texts]
     llm.ainvoke.side_effect = [
         # first run
         # first chunk
@@ -19,48 +19,40 @@ from neo4j_graphrag.schema import (
     BASE_ENTITY_LABEL,
     EXCLUDED_LABELS,
     EXCLUDED_RELS,
-    NODE_PROPERTIES_QUERY,
-    REL_PROPERTIES_QUERY,
-    REL_QUERY,
+    SCHEMA_QUERY,
+    get_structured_schema,
     query_database,
 )
 
 
 @pytest.mark.usefixtures("setup_neo4j_for_schema_query_with_excluded_labels")
-def test_filtering_labels_node_properties(driver: Driver) -> None:
-    node_properties = [
-        data["output"]
-        for data in query_database(
-            driver,
-            NODE_PROPERTIES_QUERY,
-            params={"EXCLUDED_LABELS": EXCLUDED_LABELS},
-        )
-    ]
+def test_filtering_labels_schema_query(driver: Driver) -> None:
+    rows = query_database(
+        driver,
+        SCHEMA_QUERY,
+        params={
+            "EXCLUDED_LABELS": EXCLUDED_LABELS + [BASE_ENTITY_LABEL],
+            "EXCLUDED_RELS": EXCLUDED_RELS,
+        },
+    )
 
-    assert node_properties == []
+    assert rows == []
 
 
 @pytest.mark.usefixtures("setup_neo4j_for_schema_query_with_excluded_labels")
-def test_filtering_labels_relationship_properties(driver: Driver) -> None:
-    relationship_properties = [
-        data["output"]
-        for data in query_database(
-            driver, REL_PROPERTIES_QUERY, params={"EXCLUDED_LABELS": EXCLUDED_RELS}
-        )
-    ]
+def test_filtering_labels_structured_schema(driver: Driver) -> None:
+    schema = get_structured_schema(driver)
 
-    assert relationship_properties == []
+    assert schema["node_props"] == {}
+    assert schema["rel_props"] == {}
+    assert schema["relationships"] == []
 
 
-@pytest.mark.usefixtures("setup_neo4j_for_schema_query_with_excluded_labels")
-def test_filtering_labels_relationships(driver: Driver) -> None:
-    relationships = [
-        data["output"]
-        for data in query_database(
-            driver,
-            REL_QUERY,
-            params={"EXCLUDED_LABELS": EXCLUDED_LABELS + [BASE_ENTITY_LABEL]},
-        )
-    ]
+@pytest.mark.usefixtures("setup_neo4j_for_schema_query_with_excluded_end_labels")
+def test_filtering_relationship_end_labels_structured_schema(driver: Driver) -> None:
+    schema = get_structured_schema(driver)
 
-    assert relationships == []
+    # Relationships to excluded labels are dropped client-side from `other`
+    assert schema["relationships"] == [
+        {"start": "LabelA", "type": "REL_TYPE", "end": "LabelB"}
+    ]
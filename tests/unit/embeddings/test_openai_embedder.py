@@ -48,6 +48,39 @@ def test_openai_embedder_happy_path(mock_import: Mock) -> None:
     assert res == [1.0, 2.0]
 
 
+@patch("builtins.__import__")
+def test_openai_embedder_embed_documents_batches_requests(mock_import: Mock) -> None:
+    mock_openai = get_mock_openai()
+    mock_import.return_value = mock_openai
+
+    create = mock_openai.OpenAI.return_value.embeddings.create
+    create.side_effect = [
+        MagicMock(data=[MagicMock(embedding=[1.0]), MagicMock(embedding=[2.0])]),
+        MagicMock(data=[MagicMock(embedding=[3.0])]),
+    ]
+    embedder = OpenAIEmbeddings(api_key="my key")
+    res = embedder.embed_documents(["a", "b", "c"], batch_size=2)
+    assert res == [[1.0], [2.0], [3.0]]
+    assert create.call_count == 2
+    create.assert_any_call(input=["a", "b"], model="text-embedding-ada-002")
+    create.assert_any_call(input=["c"], model="text-embedding-ada-002")
+
+
+@patch("builtins.__import__")
+def test_openai_embedder_embed_documents_default_batch_size(mock_import: Mock) -> None:
+    mock_openai = get_mock_openai()
+    mock_import.return_value = mock_openai
+
+    create = mock_openai.OpenAI.return_value.embeddings.create
+    create.side_effect = lambda input, model: MagicMock(
+        data=[MagicMock(embedding=[1.0]) for _ in input]
+    )
+    embedder = OpenAIEmbeddings(api_key="my key")
+    res = embedder.embed_documents([str(i) for i in range(20)])
+    assert len(res) == 20
+    assert [len(call.kwargs["input"]) for call in create.call_args_list] == [16, 4]
+
+
 @patch("builtins.__import__", side_effect=ImportError)
 def test_azure_openai_embedder_missing_dependency(mock_import: Mock) -> None:
     with pytest.raises(ImportError):
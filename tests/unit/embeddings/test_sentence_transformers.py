@@ -55,3 +55,17 @@ def test_embed_query(mock_import: Mock) -> None:
 def test_import_error(mock_import: Mock) -> None:
     with pytest.raises(ImportError):
         SentenceTransformerEmbeddings()
+
+
+@patch("builtins.__import__")
+def test_embed_documents(mock_import: Mock) -> None:
+    MockSentenceTransformer = get_mock_sentence_transformers()
+    mock_import.return_value = MockSentenceTransformer
+    mock_model = MockSentenceTransformer.SentenceTransformer.return_value
+    mock_model.encode.return_value = np.array([[0.1, 0.2], [0.3, 0.4]])
+
+    instance = SentenceTransformerEmbeddings()
+    result = instance.embed_documents(["first", "second"])
+
+    mock_model.encode.assert_called_once_with(["first", "second"])
+    assert result == [[0.1, 0.2], [0.3, 0.4]]
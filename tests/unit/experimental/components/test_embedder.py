@@ -24,13 +24,13 @@ from neo4j_graphrag.experimental.components.types import (
 
 @pytest.mark.asyncio
 async def test_text_chunk_embedder_run(embedder: MagicMock) -> None:
-    embedder.embed_query.return_value = [1.0, 2.0, 3.0]
+    embedder.embed_documents.return_value = [[1.0, 2.0, 3.0]]
     text_chunk_embedder = TextChunkEmbedder(embedder=embedder)
     text_chunks = TextChunks(
         chunks=[TextChunk(text="may thy knife chip and shatter", index=0)]
     )
     embedded_chunks = await text_chunk_embedder.run(text_chunks)
-    embedder.embed_query.assert_called_once_with("may thy knife chip and shatter")
+    embedder.embed_documents.assert_called_once_with(["may thy knife chip and shatter"])
     assert isinstance(embedded_chunks, TextChunks)
     for chunk in embedded_chunks.chunks:
         assert isinstance(chunk, TextChunk)
@@ -39,3 +39,72 @@ async def test_text_chunk_embedder_run(embedder: MagicMock) -> None:
         assert isinstance(chunk.metadata["embedding"], list)
         for i in chunk.metadata["embedding"]:
             assert isinstance(i, float)
+
+
+@pytest.mark.asyncio
+async def test_text_chunk_embedder_run_embeds_all_chunks_in_one_call(
+    embedder: MagicMock,
+) -> None:
+    embedder.embed_documents.return_value = [[1.0], [2.0]]
+    text_chunk_embedder = TextChunkEmbedder(embedder=embedder)
+    text_chunks = TextChunks(
+        chunks=[
+            TextChunk(text="the spice must flow", index=0),
+            TextChunk(text="fear is the mind-killer", index=1),
+        ]
+    )
+    embedded_chunks = await text_chunk_embedder.run(text_chunks)
+    embedder.embed_documents.assert_called_once_with(
+        ["the spice must flow", "fear is the mind-killer"]
+    )
+    embedder.embed_query.assert_not_called()
+    embeddings = [
+        chunk.metadata["embedding"] if chunk.metadata else None
+        for chunk in embedded_chunks.chunks
+    ]
+    assert embeddings == [[1.0], [2.0]]
+
+
+@pytest.mark.asyncio
+async def test_text_chunk_embedder_run_embedding_count_mismatch(
+    embedder: MagicMock,
+) -> None:
+    embedder.embed_documents.return_value = [[1.0]]
+    text_chunk_embedder = TextChunkEmbedder(embedder=embedder)
+    text_chunks = TextChunks(
+        chunks=[
+            TextChunk(text="the spice must flow", index=0),
+            TextChunk(text="fear is the mind-killer", index=1),
+        ]
+    )
+    with pytest.raises(ValueError, match="Expected 2 embeddings, got 1"):
+        await text_chunk_embedder.run(text_chunks)
+
+
+@pytest.mark.asyncio
+async def test_text_chunk_embedder_run_with_batch_size(embedder: MagicMock) -> None:
+    embedder.embed_documents.side_effect = [[[1.0], [2.0]], [[3.0]]]
+    text_chunk_embedder = TextChunkEmbedder(embedder=embedder, batch_size=2)
+    text_chunks = TextChunks(
+        chunks=[
+            TextChunk(text="the spice must flow", index=0),
+            TextChunk(text="fear is the mind-killer", index=1),
+            TextChunk(text="the sleeper must awaken", index=2),
+        ]
+    )
+    embedded_chunks = await text_chunk_embedder.run(text_chunks)
+    assert embedder.embed_documents.call_count == 2
+    embedder.embed_documents.assert_any_call(
+        ["the spice must flow", "fear is the mind-killer"]
+    )
+    embedder.embed_documents.assert_any_call(["the sleeper must awaken"])
+    embeddings = [
+        chunk.metadata["embedding"] if chunk.metadata else None
+        for chunk in embedded_chunks.chunks
+    ]
+    assert embeddings == [[1.0], [2.0], [3.0]]
+
+
+def test_text_chunk_embedder_invalid_batch_size(embedder: MagicMock) -> None:
+    with pytest.raises(ValueError, match="batch_size"):
+        TextChunkEmbedder(embedder=embedder, batch_size=0)
@@ -144,11 +144,13 @@ def test_simple_kg_pipeline_config_extractor(mock_llm: Mock, llm: LLMInterface)
     config = SimpleKGPipelineConfig(
         on_error="IGNORE",  # type: ignore
         prompt_template=ERExtractionTemplate(template="my template {text}"),
+        max_concurrency=8,
     )
     extractor = config._get_extractor()
     assert isinstance(extractor, LLMEntityRelationExtractor)
     assert extractor.llm == llm
     assert extractor.on_error == OnError.IGNORE
+    assert extractor.max_concurrency == 8
     assert extractor.prompt_template.template == "my template {text}"
 
 
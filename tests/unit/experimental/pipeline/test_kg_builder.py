@@ -151,6 +151,20 @@ def test_simple_kg_pipeline_on_error_invalid_value() -> None:
         )
 
 
+def test_simple_kg_pipeline_max_concurrency_invalid_value() -> None:
+    llm = MagicMock(spec=LLMInterface)
+    driver = MagicMock(spec=neo4j.Driver)
+    embedder = MagicMock(spec=Embedder)
+
+    with pytest.raises(PipelineDefinitionError):
+        SimpleKGPipeline(
+            llm=llm,
+            driver=driver,
+            embedder=embedder,
+            max_concurrency=0,
+        )
+
+
 @mock.patch(
     "neo4j_graphrag.experimental.components.kg_writer.get_version",
     return_value=((5, 23, 0), False, False),
@@ -501,3 +501,46 @@ def test_extract_cypher(
     assert (
         extract_cypher(cypher_query) == expected_output
     ), f"Failed test case: {description}"
+
+
+@patch("neo4j_graphrag.retrievers.base.get_version")
+def test_t2c_retriever_cypher_cache(
+    mock_get_version: MagicMock,
+    driver: MagicMock,
+    llm: MagicMock,
+    neo4j_record: MagicMock,
+) -> None:
+    mock_get_version.return_value = ((5, 23, 0), False, False)
+    t2c_query = "MATCH (n) RETURN n;"
+    retriever = Text2CypherRetriever(
+        driver=driver, llm=llm, neo4j_schema="dummy-schema", cypher_cache_size=1
+    )
+    llm.invoke.return_value = LLMResponse(content=t2c_query)
+    driver.execute_query.return_value = ([neo4j_record], None, None)
+
+    retriever.search(query_text="first question")
+    retriever.search(query_text="first question")
+    assert llm.invoke.call_count == 1
+    assert driver.execute_query.call_count == 2
+
+    # the oldest entry is evicted once the cache is full
+    retriever.search(query_text="second question")
+    retriever.search(query_text="first question")
+    assert llm.invoke.call_count == 3
+
+
+@patch("neo4j_graphrag.retrievers.base.get_version")
+def test_t2c_retriever_cypher_cache_skips_failed_queries(
+    mock_get_version: MagicMock, driver: MagicMock, llm: MagicMock
+) -> None:
+    mock_get_version.return_value = ((5, 23, 0), False, False)
+    retriever = Text2CypherRetriever(
+        driver=driver, llm=llm, neo4j_schema="dummy-schema", cypher_cache_size=10
+    )
+    llm.invoke.return_value = LLMResponse(content="this is not a cypher query")
+    driver.execute_query.side_effect = CypherSyntaxError
+
+    for _ in range(2):
+        with pytest.raises(Text2CypherRetrievalError):
+            retriever.search(query_text="question")
+    assert llm.invoke.call_count == 2
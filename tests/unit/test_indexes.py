@@ -17,6 +17,7 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 
 import neo4j.exceptions
+import numpy as np
 import pytest
 from neo4j_graphrag.exceptions import Neo4jIndexError, Neo4jInsertionError
 from neo4j_graphrag.indexes import (
@@ -27,6 +28,7 @@ from neo4j_graphrag.indexes import (
     upsert_vector_on_relationship,
     upsert_vectors,
 )
+from neo4j_graphrag.neo4j_queries import UPSERT_VECTORS_ON_NODE_QUERY
 
 
 def test_create_vector_index_happy_path(driver: MagicMock) -> None:
@@ -61,6 +63,29 @@ def test_create_vector_index_fail_if_exists(driver: MagicMock) -> None:
     )
 
 
+def test_create_vector_index_quantization_enabled(driver: MagicMock) -> None:
+    create_query = (
+        "CREATE VECTOR INDEX $name IF NOT EXISTS FOR (n:People) ON n.name OPTIONS "
+        "{ indexConfig: { `vector.dimensions`: toInteger($dimensions), `vector.similarity_function`: $similarity_fn, "
+        "`vector.quantization.enabled`: $quantization_enabled } }"
+    )
+
+    create_vector_index(
+        driver, "my-index", "People", "name", 2048, "cosine", quantization_enabled=True
+    )
+
+    driver.execute_query.assert_called_once_with(
+        create_query,
+        {
+            "name": "my-index",
+            "dimensions": 2048,
+            "similarity_fn": "cosine",
+            "quantization_enabled": True,
+        },
+        database_=None,
+    )
+
+
 def test_create_vector_index_ensure_escaping(driver: MagicMock) -> None:
     create_query = (
         "CREATE VECTOR INDEX $name IF NOT EXISTS FOR (n:People) ON n.name OPTIONS "
@@ -325,3 +350,57 @@ def test_upsert_vectors_inconsistent_embedding_sizes(driver: MagicMock) -> None:
             neo4j_database="neo4j",
         )
     assert str(exc_info.value) == "All embeddings must be of the same size"
+
+
+def test_upsert_vectors_batches_rows(driver: MagicMock) -> None:
+    upsert_vectors(
+        driver=driver,
+        ids=["1", "2", "3"],
+        embedding_property="embedding",
+        embeddings=[[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]],
+        batch_size=2,
+    )
+
+    assert driver.execute_query.call_count == 2
+    first_call, second_call = driver.execute_query.call_args_list
+    assert first_call.kwargs["query_"] == UPSERT_VECTORS_ON_NODE_QUERY
+    assert first_call.kwargs["parameters_"] == {
+        "rows": [
+            {"id": "1", "embedding": [1.0, 2.0]},
+            {"id": "2", "embedding": [3.0, 4.0]},
+        ],
+        "embedding_property": "embedding",
+    }
+    assert second_call.kwargs["parameters_"]["rows"] == [
+        {"id": "3", "embedding": [5.0, 6.0]}
+    ]
+
+
+def test_upsert_vectors_invalid_batch_size(driver: MagicMock) -> None:
+    with pytest.raises(ValueError) as exc_info:
+        upsert_vectors(
+            driver=driver,
+            ids=["1"],
+            embedding_property="embedding",
+            embeddings=[[1.0, 2.0, 3.0]],
+            batch_size=0,
+        )
+    assert str(exc_info.value) == "batch_size must be a positive integer"
+
+
+def test_upsert_vectors_accepts_numpy_matrix(driver: MagicMock) -> None:
+    embeddings = np.array([[1.0, 2.0], [3.0, 4.0]], dtype=np.float32)
+
+    upsert_vectors(
+        driver=driver,
+        ids=["1", "2"],
+        embedding_property="embedding",
+        embeddings=embeddings,
+    )
+
+    rows = driver.execute_query.call_args.kwargs["parameters_"]["rows"]
+    assert [row["id"] for row in rows] == ["1", "2"]
+    assert all(isinstance(row["embedding"], np.ndarray) for row in rows)
+    np.testing.assert_array_equal(
+        np.stack([row["embedding"] for row in rows]), embeddings
+    )
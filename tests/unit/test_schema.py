@@ -19,6 +19,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from neo4j import Driver, Query
+from neo4j_graphrag import schema as schema_module
 from neo4j_graphrag.schema import (
     BASE_ENTITY_LABEL,
     BASE_KG_BUILDER_LABEL,
@@ -26,9 +27,7 @@ from neo4j_graphrag.schema import (
     EXCLUDED_RELS,
     INDEX_QUERY,
     LIST_LIMIT,
-    NODE_PROPERTIES_QUERY,
-    REL_PROPERTIES_QUERY,
-    REL_QUERY,
+    SCHEMA_QUERY,
     _value_sanitize,
     format_schema,
     get_enhanced_schema_cypher,
@@ -37,30 +36,45 @@ from neo4j_graphrag.schema import (
 )
 
 
+@pytest.mark.parametrize(
+    "name", ["NODE_PROPERTIES_QUERY", "REL_PROPERTIES_QUERY", "REL_QUERY"]
+)
+def test_deprecated_schema_queries_warn(name: str) -> None:
+    with pytest.warns(DeprecationWarning, match=name):
+        query = getattr(schema_module, name)
+    assert query.startswith("CALL apoc.meta.data()")
+
+
+def test_unknown_schema_attribute_raises() -> None:
+    with pytest.raises(AttributeError):
+        getattr(schema_module, "NOT_A_QUERY")
+
+
 def _query_return_value(*args: Any, **kwargs: Any) -> list[Any]:
     query = kwargs.get("query", args[1] if len(args) > 1 else None)
-    if NODE_PROPERTIES_QUERY in query:
+    if SCHEMA_QUERY == query:
         return [
             {
-                "output": {
-                    "properties": [{"property": "property_a", "type": "STRING"}],
-                    "label": "LabelA",
-                }
-            }
-        ]
-    if REL_PROPERTIES_QUERY in query:
-        return [
+                "label": "LabelA",
+                "other": [],
+                "elementType": "node",
+                "type": "STRING",
+                "property": "property_a",
+            },
             {
-                "output": {
-                    "type": "REL_TYPE",
-                    "properties": [{"property": "rel_prop", "type": "STRING"}],
-                }
-            }
-        ]
-    if REL_QUERY in query:
-        return [
-            {"output": {"start": "LabelA", "type": "REL_TYPE", "end": "LabelB"}},
-            {"output": {"start": "LabelA", "type": "REL_TYPE", "end": "LabelC"}},
+                "label": "LabelA",
+                "other": ["LabelB", "LabelC", BASE_ENTITY_LABEL],
+                "elementType": "node",
+                "type": "RELATIONSHIP",
+                "property": "REL_TYPE",
+            },
+            {
+                "label": "REL_TYPE",
+                "other": [],
+                "elementType": "relationship",
+                "type": "STRING",
+                "property": "rel_prop",
+            },
         ]
     if "SHOW CONSTRAINTS" == query:
         return ["fake constraints"]
@@ -87,46 +101,29 @@ The relationships:
 
 def test_get_structured_schema_happy_path(driver: MagicMock) -> None:
     get_structured_schema(driver)
-    assert 5 == driver.execute_query.call_count
+    assert 3 == driver.execute_query.call_count
     calls = driver.execute_query.call_args_list
 
     args, kwargs = calls[0]
     query_obj = args[0]
     assert isinstance(query_obj, Query)
-    assert query_obj.text == NODE_PROPERTIES_QUERY
+    assert query_obj.text == SCHEMA_QUERY
     assert query_obj.timeout is None
     assert kwargs["database_"] is None
     assert kwargs["parameters_"] == {
-        "EXCLUDED_LABELS": EXCLUDED_LABELS + [BASE_ENTITY_LABEL, BASE_KG_BUILDER_LABEL]
+        "EXCLUDED_LABELS": EXCLUDED_LABELS + [BASE_ENTITY_LABEL, BASE_KG_BUILDER_LABEL],
+        "EXCLUDED_RELS": EXCLUDED_RELS,
     }
 
     args, kwargs = calls[1]
     query_obj = args[0]
     assert isinstance(query_obj, Query)
-    assert query_obj.text == REL_PROPERTIES_QUERY
-    assert query_obj.timeout is None
-    assert kwargs["database_"] is None
-    assert kwargs["parameters_"] == {"EXCLUDED_LABELS": EXCLUDED_RELS}
-
-    args, kwargs = calls[2]
-    query_obj = args[0]
-    assert isinstance(query_obj, Query)
-    assert query_obj.text == REL_QUERY
-    assert query_obj.timeout is None
-    assert kwargs["database_"] is None
-    assert kwargs["parameters_"] == {
-        "EXCLUDED_LABELS": EXCLUDED_LABELS + [BASE_ENTITY_LABEL, BASE_KG_BUILDER_LABEL]
-    }
-
-    args, kwargs = calls[3]
-    query_obj = args[0]
-    assert isinstance(query_obj, Query)
     assert query_obj.text == "SHOW CONSTRAINTS"
     assert query_obj.timeout is None
     assert kwargs["database_"] is None
     assert kwargs["parameters_"] == {}
 
-    args, kwargs = calls[4]
+    args, kwargs = calls[2]
     query_obj = args[0]
     assert isinstance(query_obj, Query)
     assert query_obj.text == INDEX_QUERY
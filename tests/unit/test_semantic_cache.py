@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+import semantic_cache
+from neo4j_graphrag.embeddings.base import Embedder
+from semantic_cache import SemanticCache, batch_cosine
+
+BASE = [1.0, 0.0, 0.0, 0.0]
+# cosine ~0.995 with BASE: above the default 0.97 threshold
+NEAR = [1.0, 0.1, 0.0, 0.0]
+# cosine ~0.894 with BASE: below it
+FAR = [1.0, 0.5, 0.0, 0.0]
+OTHER = [0.0, 0.0, 1.0, 0.0]
+
+
+class FakeEmbedder(Embedder):
+    def __init__(self, vectors: dict[str, list[float]]) -> None:
+        self.vectors = vectors
+        self.calls: list[str] = []
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return self.vectors[text]
+
+
+class FakeSearch:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, query_text: str) -> str:
+        self.calls.append(query_text)
+        return f"answer to {query_text}"
+
+
+@pytest.fixture
+def embedder() -> FakeEmbedder:
+    return FakeEmbedder({"base": BASE, "near": NEAR, "far": FAR, "other": OTHER})
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1_000.0]
+    monkeypatch.setattr("semantic_cache.time.time", lambda: now[0])
+    return now
+
+
+def test_semantic_cache_hit_above_threshold(embedder: FakeEmbedder) -> None:
+    cache = SemanticCache(embedder)
+    search = FakeSearch()
+
+    assert cache.answer("base", search) == "answer to base"
+    assert cache.answer("near", search) == "answer to base"
+    assert search.calls == ["base"]
+
+
+def test_semantic_cache_miss_below_threshold(embedder: FakeEmbedder) -> None:
+    cache = SemanticCache(embedder)
+    search = FakeSearch()
+
+    cache.answer("base", search)
+    assert cache.answer("far", search) == "answer to far"
+    assert search.calls == ["base", "far"]
+
+
+def test_semantic_cache_exact_repeat_skips_embedding(embedder: FakeEmbedder) -> None:
+    cache = SemanticCache(embedder)
+    search = FakeSearch()
+
+    cache.answer("base", search)
+    cache.answer("base", search)
+    assert embedder.calls == ["base"]
+    assert search.calls == ["base"]
+
+
+def test_semantic_cache_ttl_expiry(embedder: FakeEmbedder, clock: list[float]) -> None:
+    cache = SemanticCache(embedder, ttl=10)
+    search = FakeSearch()
+
+    cache.answer("base", search)
+    clock[0] += 11
+    assert cache.lookup_text("base") is None
+    assert cache.lookup(cache._quantize(NEAR)) is None
+    assert cache.answer("base", search) == "answer to base"
+    assert search.calls == ["base", "base"]
+
+
+def test_semantic_cache_overflow_evicts_oldest(embedder: FakeEmbedder) -> None:
+    cache = SemanticCache(embedder, max_entries=2)
+    search = FakeSearch()
+
+    for query in ("base", "far", "other"):
+        cache.answer(query, search)
+
+    assert cache._queries == ["far", "other"]
+    assert cache.lookup_text("base") is None
+    assert cache.lookup(cache._quantize(BASE)) is None
+    assert cache.lookup_text("far") == "answer to far"
+
+
+def test_semantic_cache_eviction_keeps_newer_entry_for_same_text(
+    embedder: FakeEmbedder,
+) -> None:
+    cache = SemanticCache(embedder, max_entries=2)
+    vector = cache._quantize(BASE)
+    cache.insert("base", vector, "old")
+    cache.insert("base", vector, "new")
+    cache.insert("other", cache._quantize(OTHER), "other")
+
+    # Evicting the first "base" entry must not drop the newer one
+    assert cache.lookup_text("base") == "new"
+
+
+def test_semantic_cache_reloads_from_db(tmp_path: Path, embedder: FakeEmbedder) -> None:
+    path = str(tmp_path / "cache.db")
+    search = FakeSearch()
+    SemanticCache(embedder, path=path, namespace="a").answer("base", search)
+
+    reloaded = SemanticCache(embedder, path=path, namespace="a")
+    assert reloaded._vectors is not None
+    assert reloaded._vectors.dtype == np.int8
+    assert reloaded.lookup_text("base") == "answer to base"
+    assert reloaded.answer("near", search) == "answer to base"
+    assert search.calls == ["base"]
+
+    assert SemanticCache(embedder, path=path, namespace="b")._answers == []
+
+
+def test_semantic_cache_reload_drops_expired_rows(
+    tmp_path: Path, embedder: FakeEmbedder, clock: list[float]
+) -> None:
+    path = str(tmp_path / "cache.db")
+    SemanticCache(embedder, path=path, ttl=10).answer("base", FakeSearch())
+
+    clock[0] += 11
+    reloaded = SemanticCache(embedder, path=path, ttl=10)
+    assert reloaded._answers == []
+    assert reloaded._db is not None
+    count = reloaded._db.execute("SELECT count(*) FROM semantic_cache").fetchone()
+    assert count == (0,)
+
+
+def test_semantic_cache_db_errors_still_cache_in_memory(
+    tmp_path: Path, embedder: FakeEmbedder, caplog: pytest.LogCaptureFixture
+) -> None:
+    cache = SemanticCache(embedder, max_entries=1, path=str(tmp_path / "cache.db"))
+    assert cache._db is not None
+    cache._db.close()
+
+    cache.insert("base", cache._quantize(BASE), "base")
+    assert cache.lookup_text("base") == "base"
+    cache.insert("other", cache._quantize(OTHER), "other")
+    assert cache.lookup_text("other") == "other"
+    assert cache._ids == [None]
+    assert "Could not persist semantic cache entry" in caplog.text
+
+
+def test_semantic_cache_eviction_only_deletes_own_rows(
+    tmp_path: Path, embedder: FakeEmbedder
+) -> None:
+    path = str(tmp_path / "cache.db")
+    first = SemanticCache(embedder, max_entries=1, path=path)
+    second = SemanticCache(embedder, max_entries=1, path=path)
+
+    second.insert("far", second._quantize(FAR), "far")
+    first.insert("base", first._quantize(BASE), "base")
+    # Evicting "base" must leave the older row written by the other worker
+    first.insert("other", first._quantize(OTHER), "other")
+
+    assert first._db is not None
+    rows = first._db.execute("SELECT query FROM semantic_cache ORDER BY id").fetchall()
+    assert rows == [("far",), ("other",)]
+
+
+def test_semantic_cache_lookups_do_not_wait_for_db_writes(
+    tmp_path: Path, embedder: FakeEmbedder
+) -> None:
+    cache = SemanticCache(embedder, path=str(tmp_path / "cache.db"))
+    cache.insert("base", cache._quantize(BASE), "base")
+
+    # Simulate a write stuck waiting on the database
+    with cache._db_lock:
+        writer = threading.Thread(
+            target=cache.insert, args=("other", cache._quantize(OTHER), "other")
+        )
+        writer.start()
+        assert cache.lookup_text("base") == "base"
+        assert cache.lookup(cache._quantize(NEAR)) == "base"
+    writer.join(timeout=5)
+    assert cache.lookup_text("other") == "other"
+
+
+def test_quantize_preserves_cosine() -> None:
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((8, 1536)).astype(np.float32)
+    query = vectors[0] + 0.1 * rng.standard_normal(1536).astype(np.float32)
+
+    quantized = np.vstack([SemanticCache._quantize(v) for v in vectors])
+    assert quantized.dtype == np.int8
+    np.testing.assert_allclose(
+        batch_cosine(SemanticCache._quantize(query), quantized),
+        _numpy_cosine(query, vectors),
+        atol=1e-2,
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.int8])
+def test_batch_cosine_simsimd_matches_numpy(
+    monkeypatch: pytest.MonkeyPatch, dtype: Any
+) -> None:
+    pytest.importorskip("simsimd")
+    rng = np.random.default_rng(0)
+    matrix = (rng.standard_normal((16, 64)) * 40).astype(dtype)
+    query = (rng.standard_normal(64) * 40).astype(dtype)
+
+    with_simsimd = batch_cosine(query, matrix)
+    monkeypatch.setattr(semantic_cache, "simsimd", None)
+    with_numpy = batch_cosine(query, matrix)
+
+    np.testing.assert_allclose(with_simsimd, with_numpy, atol=1e-3)
+
+
+def _numpy_cosine(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    similarities: np.ndarray = (matrix @ query) / (
+        np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    )
+    return similarities